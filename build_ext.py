@@ -0,0 +1,23 @@
+"""
+Build-only helper that compiles security_scraper.py into a C extension with
+Cython. It is not a packaging script; the scraper itself needs no build:
+
+    pip install cython
+    python build_ext.py build_ext --inplace
+
+The compiled module takes precedence over security_scraper.py on
+`import security_scraper`. Rebuild after editing the source, or delete the
+built extension, otherwise the old compiled code keeps running.
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit("Cython is required to build the extension: pip install cython")
+
+setup(
+    name="security_scraper",
+    py_modules=[],
+    ext_modules=cythonize("security_scraper.py", language_level=3),
+)
@@ -1,8 +1,36 @@
+import asyncio
+import collections
+import functools
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
 import re
+import sys
+import time
 import urllib.parse
 
+try:
+    import httpx
+except ImportError:  # Admin panel probing falls back to a thread pool
+    httpx = None
+
+try:
+    import h2  # noqa: F401 -- lets httpx negotiate HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Progress and error messages. Records are only shown once a handler is
+# attached, see _create_log_listener().
+log = logging.getLogger('security_scraper')
+log.setLevel(logging.INFO)
+
 # --- Configuration ---
 # User-Agent header to mimic a web browser. Some sites block requests without it.
 HEADERS = {
@@ -10,54 +38,285 @@ HEADERS = {
 }
 
 # Common paths to check for admin panels or login pages
-ADMIN_PATHS = [
+ADMIN_PATHS = (
     '/admin', '/administrator', '/login', '/wp-admin', '/dashboard',
     '/cpanel', '/phpmyadmin', '/webmail', '/user/login', '/panel'
-]
+)
+
+# Only the tags inspected by the checks are kept when parsing a page
+_STRAINER = SoupStrainer(['title', 'meta', 'pre', 'script', 'link'])
+
+# Directory listings announce themselves within the first part of the document.
+# Styled listings can carry several KB of inline CSS before the heading.
+DIR_LISTING_SNIFF_CHARS = 16 * 1024
+
+# Pre-compiled patterns used by the heuristic checks
+_INDEX_OF_RE = re.compile(r"Index of /", re.IGNORECASE)
+_DIR_HDR_RE = re.compile(r"Name\s+Last modified\s+Size\s+Description", re.IGNORECASE)
+# Explicit charset parameter of a Content-Type header
+_CHARSET_RE = re.compile(r"""charset\s*=\s*["']?([^"';\s]+)""", re.IGNORECASE)
+# Version query parameter in script/link resource URLs
+# Example: /wp-includes/css/dashicons.min.css?ver=5.8.1
+_VER_PARAM_RE = re.compile(r'[?&]ver=(\d+\.\d+(?:\.\d+)?)')
+# Elements whose content is not visible text
+_NON_TEXT_TAGS = ('script', 'style')
+# Size of the blocks fed to the incremental text extractor
+TEXT_FEED_CHARS = 64 * 1024
+# Footer text patterns fused into one alternation so the page text is scanned once.
+# The apache group checks for server banners if available (less common in HTML).
+_FOOTER_RE = re.compile(
+    r"(?P<cms>powered by (?:wordpress|joomla|drupal|magento) v?\d+\.\d+(?:\.\d+){0,2})"
+    r"|(?P<ver>version \d+\.\d+(?:\.\d+){0,2})"
+    r"|(?P<apache>apache/\d+\.\d+(?:\.\d+)?)",
+    re.IGNORECASE
+)
+
+# Characters of preceding text kept when scanning the next text chunk; longer
+# than any footer pattern match.
+FOOTER_OVERLAP_CHARS = 64
+
+# Maximum number of body bytes read per page. This bounds memory and parse
+# time on huge or hostile pages; anything past it, footers included, is not
+# inspected, so the cap is set well above the size of ordinary pages.
+MAX_BODY_BYTES = 5 * 1024 * 1024
+# Size of the blocks a streamed body is read in
+READ_BLOCK_BYTES = 64 * 1024
+
+# Fetched pages are cached across scans in one session, bounded by the total
+# size of their bodies and expired after RESPONSE_CACHE_TTL seconds.
+RESPONSE_CACHE_BYTES = 32 * 1024 * 1024
+RESPONSE_CACHE_TTL = 300
+
+# Final status codes (after following redirects) that reveal an existing
+# admin panel. 401/403 mean the page exists but is protected, which is still
+# worth reporting.
+PANEL_STATUS_CODES = (200, 401, 403)
+
+# Static site hosts, which never serve admin panels: (name, Server / X-Powered-By
+# banner, host suffix). Both must match, since e.g. github.com itself also
+# sends "Server: GitHub.com".
+STATIC_HOST_SIGNATURES = (
+    ('GitHub Pages', 'github.com', '.github.io'),
+    ('Netlify', 'netlify', '.netlify.app'),
+    ('Amazon S3', 'amazons3', '.amazonaws.com'),
+)
+
+# Maximum number of simultaneous connections used while probing admin paths
+MAX_CONCURRENT_PROBES = 20
+
+# Shared HTTP session so repeated requests to the same host reuse pooled
+# keep-alive connections instead of paying a new TCP/TLS handshake each time.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                       max_retries=Retry(total=2, backoff_factor=0.1))
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
 
 # --- Helper Functions ---
 
+# A fetched page as kept in the response cache. `content` holds the body,
+# truncated to MAX_BODY_BYTES.
+CachedResponse = collections.namedtuple('CachedResponse', ['url', 'status_code', 'content', 'headers'])
+
+class _ResponseCache:
+    """
+    LRU cache of CachedResponse objects keyed by URL. Entries expire after
+    `ttl` seconds, and the least recently used ones are evicted once the
+    cached bodies exceed `max_bytes` in total.
+    """
+    def __init__(self, max_bytes=RESPONSE_CACHE_BYTES, ttl=RESPONSE_CACHE_TTL):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()  # url -> (expires_at, response)
+        self._size = 0
+
+    def get(self, url):
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        expires_at, response = entry
+        if expires_at < time.monotonic():
+            self._discard(url)
+            return None
+        self._entries.move_to_end(url)
+        return response
+
+    def put(self, url, response):
+        self._discard(url)
+        if len(response.content) > self.max_bytes:
+            return
+        self._entries[url] = (time.monotonic() + self.ttl, response)
+        self._size += len(response.content)
+        while self._size > self.max_bytes:
+            self._discard(next(iter(self._entries)))
+
+    def clear(self):
+        self._entries.clear()
+        self._size = 0
+
+    def _discard(self, url):
+        entry = self._entries.pop(url, None)
+        if entry is not None:
+            self._size -= len(entry[1].content)
+
+_RESPONSE_CACHE = _ResponseCache()
+
+def _read_capped(response, max_bytes=MAX_BODY_BYTES):
+    """
+    Reads at most `max_bytes` of a streamed response body and closes it.
+    The body is read through iter_content so transport errors surface as
+    requests exceptions.
+    """
+    body = bytearray()
+    try:
+        for block in response.iter_content(READ_BLOCK_BYTES):
+            body += block
+            if len(body) >= max_bytes:
+                break
+    finally:
+        response.close()
+    return bytes(body[:max_bytes])
+
+def _fetch(url):
+    """
+    Fetches a URL through the shared session.
+    The body is streamed and capped at MAX_BODY_BYTES to bound memory use.
+    Returns a CachedResponse; failed requests raise.
+    """
+    response = SESSION.get(url, timeout=10, stream=True)
+    try:
+        response.raise_for_status()  # Raise an HTTPError for bad responses (4xx or 5xx)
+    except requests.exceptions.HTTPError:
+        response.close()
+        raise
+    body = _read_capped(response)
+    return CachedResponse(response.url, response.status_code, body, response.headers)
+
 def fetch_url_content(url):
     """
     Fetches the content of a given URL.
-    Returns the response object if successful, None otherwise.
+    Repeated fetches of the same URL are served from an in-memory cache;
+    failures are never cached.
+    Returns a CachedResponse if successful, None otherwise.
     """
     try:
-        print(f"[*] Fetching: {url}")
-        response = requests.get(url, headers=HEADERS, timeout=10)
-        response.raise_for_status()  # Raise an HTTPError for bad responses (4xx or 5xx)
+        log.info("[*] Fetching: %s", url)
+        response = _RESPONSE_CACHE.get(url)
+        if response is None:
+            response = _fetch(url)
+            _RESPONSE_CACHE.put(url, response)
         return response
     except requests.exceptions.RequestException as e:
-        print(f"[-] Error fetching {url}: {e}")
+        log.warning("[-] Error fetching %s: %s", url, e)
         return None
 
-def check_open_directory(response):
+def _declared_encoding(response):
     """
-    Checks if the response content indicates an open directory listing.
+    Returns the charset declared in the response's Content-Type header, or
+    None. Unlike response.encoding, no ISO-8859-1 default is assumed for
+    text/* responses without a charset.
+    """
+    match = _CHARSET_RE.search(response.headers.get('Content-Type', ''))
+    return match.group(1) if match else None
+
+def _decode_body(raw, encoding):
+    """
+    Decodes a response body to text, falling back to UTF-8 when the
+    encoding is missing or unknown. Undecodable bytes are replaced.
+    """
+    try:
+        return raw.decode(encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return raw.decode('utf-8', errors='replace')
+
+class _TextCollector:
+    """
+    lxml parser target that collects the visible text nodes of a page.
+    Adjacent data events are merged into one node, and script/style content
+    and comments are skipped.
+    """
+    def __init__(self):
+        self.chunks = []
+        self._buffer = []
+        self._skip_depth = 0
+
+    def _flush(self):
+        chunk = ''.join(self._buffer).strip()
+        if chunk:
+            self.chunks.append(chunk)
+        self._buffer = []
+
+    def start(self, tag, attrib):
+        self._flush()
+        if tag in _NON_TEXT_TAGS:
+            self._skip_depth += 1
+
+    def end(self, tag):
+        self._flush()
+        if tag in _NON_TEXT_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def data(self, data):
+        if not self._skip_depth:
+            self._buffer.append(data)
+
+    def close(self):
+        self._flush()
+
+    def drain(self):
+        chunks, self.chunks = self.chunks, []
+        return chunks
+
+def _iter_text(html_text):
+    """
+    Yields the visible text chunks of a raw HTML string.
+    The text is fed to lxml's event parser block by block, so extraction is
+    linear in the page size and no DOM is built.
+    """
+    collector = _TextCollector()
+    parser = etree.HTMLParser(target=collector)
+    for start in range(0, len(html_text), TEXT_FEED_CHARS):
+        parser.feed(html_text[start:start + TEXT_FEED_CHARS])
+        yield from collector.drain()
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:  # Raised for documents without any element
+        pass
+    yield from collector.drain()
+
+def check_open_directory(soup, html_text):
+    """
+    Checks if the parsed page indicates an open directory listing.
     Looks for common patterns like "Index of /" in the title or body.
+    After the title check, the beginning of the raw `html_text` is sniffed
+    and the rest of the tree is only searched when it mentions "Index of /".
     """
-    if not response:
+    if soup is None:
         return False
 
-    soup = BeautifulSoup(response.text, 'html.parser')
-
     # Check title tag
     if soup.title and "index of /" in soup.title.get_text().lower():
         return True
 
+    # Cheap pre-filter before any tree traversal
+    if "index of /" not in html_text[:DIR_LISTING_SNIFF_CHARS].lower():
+        return False
+
     # Check for common directory listing elements (e.g., <pre>, <table>)
     # This is a heuristic and might have false positives/negatives
-    if soup.find(string=re.compile(r"Index of /", re.IGNORECASE)) or \
-       soup.find('pre', string=re.compile(r"Name\s+Last modified\s+Size\s+Description", re.IGNORECASE)):
+    if soup.find(string=_INDEX_OF_RE) or soup.find('pre', string=_DIR_HDR_RE):
         return True
 
     return False
 
-def check_outdated_software(soup):
+def check_outdated_software(soup, html_text):
     """
     Attempts to identify signs of outdated software versions.
     This is highly heuristic and depends on common patterns.
     Examples: "Powered by WordPress X.Y.Z", specific meta tags.
+    `soup` only needs the tags kept by _STRAINER; footer text is read from
+    the raw `html_text`.
     """
     findings = []
 
@@ -68,50 +327,201 @@ def check_outdated_software(soup):
         findings.append(f"Potential software identified via meta tag: {generator_info}")
 
     # Check for common footer text patterns
-    footer_text_patterns = [
-        r"powered by (wordpress|joomla|drupal|magento) v?(\d+\.\d+(\.\d+)?(\.\d+)?)",
-        r"version (\d+\.\d+(\.\d+)?(\.\d+)?)",
-        r"apache/(\d+\.\d+(\.\d+)?)", # Check for server headers if available (less common in HTML)
-    ]
-    for pattern in footer_text_patterns:
-        match = re.search(pattern, soup.get_text(), re.IGNORECASE)
-        if match:
-            findings.append(f"Potential software version found in text: {match.group(0)}")
+    # Text chunks are scanned as they are produced, and only the first hit of
+    # each kind is reported, so scanning stops once every kind has matched.
+    # The tail of the previous window is carried over so that matches spanning
+    # tags (e.g. "Powered by <a>Drupal</a> 7.1") are still found.
+    seen_kinds = set()
+    tail = ''
+    for chunk in _iter_text(html_text):
+        window = f"{tail} {chunk}" if tail else chunk
+        tail = window[-FOOTER_OVERLAP_CHARS:]
+        for match in _FOOTER_RE.finditer(window):
+            if match.lastgroup not in seen_kinds:
+                seen_kinds.add(match.lastgroup)
+                findings.append(f"Potential software version found in text: {match.group(0)}")
+        if len(seen_kinds) == _FOOTER_RE.groups:
+            break
 
     # Check for specific script/CSS file paths that might reveal versions
+    # A resource included several times is only reported once.
+    versioned_resources = {}
     for link in soup.find_all(['script', 'link']):
         src = link.get('src') or link.get('href')
         if src:
-            # Example: /wp-includes/css/dashicons.min.css?ver=5.8.1
-            match = re.search(r'ver=(\d+\.\d+(\.\d+)?)', src)
+            match = _VER_PARAM_RE.search(src)
             if match:
-                findings.append(f"Potential version parameter in resource URL: {src} (version: {match.group(1)})")
+                versioned_resources.setdefault(src, match.group(1))
+    for src, version in versioned_resources.items():
+        findings.append(f"Potential version parameter in resource URL: {src} (version: {version})")
 
     return findings
 
-def check_exposed_admin_panels(base_url):
+def _root(base_url):
+    """
+    Returns the scheme://host part of a URL, onto which the absolute
+    ADMIN_PATHS can be concatenated directly.
+    """
+    parts = urllib.parse.urlsplit(base_url)
+    return urllib.parse.urlunsplit((parts.scheme, parts.netloc, '', '', ''))
+
+@functools.lru_cache(maxsize=128)
+def _plan(root):
+    """
+    Returns the tuple of admin panel URLs to probe for a site root.
+    ADMIN_PATHS is fixed, so the plan is memoized across repeated scans.
+    """
+    return tuple(root + path for path in ADMIN_PATHS)
+
+def _static_host(url, headers):
+    """
+    Identifies a known static site host from a URL and the headers it
+    responded with. Returns the host's name, or None.
+    """
+    hostname = (urllib.parse.urlsplit(url).hostname or '').lower()
+    banner = ' '.join(headers.get(name, '') for name in ('Server', 'X-Powered-By')).lower()
+    for name, signature, host_suffix in STATIC_HOST_SIGNATURES:
+        if signature in banner and ('.' + hostname).endswith(host_suffix):
+            return name
+    return None
+
+def _preflight_headers(root):
+    """
+    Sends a single HEAD request to the site root and returns its headers,
+    or an empty dict if the request fails.
+    """
+    try:
+        return SESSION.head(root + '/', timeout=10, allow_redirects=True).headers
+    except requests.exceptions.RequestException as e:
+        log.warning("[-] Error fetching %s/: %s", root, e)
+        return {}
+
+def head_url(url):
+    """
+    Probes a URL with a HEAD request through the shared session, falling back
+    to GET if the server does not allow HEAD (405). No body is downloaded.
+    Returns a (status_code, final_url) tuple, or (None, url) on errors.
+    """
+    try:
+        response = SESSION.head(url, timeout=10, allow_redirects=True)
+        if response.status_code == 405:
+            response = SESSION.get(url, timeout=10, stream=True)
+            response.close()
+        return response.status_code, response.url
+    except requests.exceptions.RequestException as e:
+        log.warning("[-] Error fetching %s: %s", url, e)
+        return None, url
+
+async def _afetch(client, url):
+    """
+    Asynchronously probes a URL with the given httpx client.
+    Sends a HEAD request so no response body is downloaded, falling back to
+    GET if the server does not allow HEAD (405).
+    Returns the HTTP status code; network errors propagate to the caller.
+    """
+    response = await client.head(url)
+    if response.status_code != 405:
+        return response.status_code
+    # The body is never read, so leaving the stream discards it unread.
+    async with client.stream('GET', url) as response:
+        return response.status_code
+
+async def _probe_all(urls):
+    """
+    Probes all URLs concurrently on a single httpx client. When the server
+    speaks HTTP/2 the probes are multiplexed over one connection.
+    Returns the status codes in the order of `urls`, None for failed probes.
+    """
+    limits = httpx.Limits(max_connections=MAX_CONCURRENT_PROBES,
+                          max_keepalive_connections=MAX_CONCURRENT_PROBES)
+    async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, headers=HEADERS, timeout=10,
+                                 limits=limits, follow_redirects=True) as client:
+        tasks = [_afetch(client, url) for url in urls]
+        responses = await asyncio.gather(*tasks, return_exceptions=True)
+
+    statuses = []
+    for url, status in zip(urls, responses):
+        if isinstance(status, Exception):
+            log.warning("[-] Error fetching %s: %r", url, status)
+            status = None
+        statuses.append(status)
+    return statuses
+
+def _in_event_loop():
+    """
+    Checks whether the caller is running inside an asyncio event loop
+    (async code, Jupyter), where asyncio.run() cannot be used.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+def check_exposed_admin_panels(base_url, headers=None):
     """
     Checks common admin panel paths for a given base URL.
+    `headers` of an already fetched page on the same host are used to skip
+    the checks on static site hosts; without them a HEAD pre-flight to the
+    site root is sent first.
+    All paths are probed concurrently, on an httpx event loop when httpx
+    is installed and on a thread pool otherwise. The thread pool is also
+    used when called from a running event loop.
     Returns a list of accessible admin panel URLs.
     """
+    # The base URL is parsed once; every admin path is absolute, so joining
+    # reduces to concatenation onto the root (see _plan).
+    root = _root(base_url)
+    if headers is None:
+        headers = _preflight_headers(root)
+    static_host = _static_host(root, headers)
+    if static_host:
+        log.info("[*] %s is served by %s; skipping admin panel checks", root, static_host)
+        return []
+
+    urls = _plan(root)
+    for full_url in urls:
+        log.info("[*] Checking for admin panel: %s", full_url)
+
+    if httpx is not None and not _in_event_loop():
+        statuses = asyncio.run(_probe_all(urls))
+    else:
+        # requests releases the GIL while waiting on the socket, so the
+        # probes overlap almost perfectly.
+        with ThreadPoolExecutor(max_workers=min(len(urls), MAX_CONCURRENT_PROBES)) as executor:
+            statuses = [status for status, _ in executor.map(head_url, urls)]
+
     accessible_panels = []
-    for path in ADMIN_PATHS:
-        full_url = urllib.parse.urljoin(base_url, path)
-        print(f"[*] Checking for admin panel: {full_url}")
-        response = fetch_url_content(full_url)
-        if response and response.status_code == 200:
-            # A 200 OK status indicates the page exists.
+    for full_url, status in zip(urls, statuses):
+        if status in PANEL_STATUS_CODES:
+            # A 200 OK (or an auth challenge) indicates the page exists.
             # Further analysis would be needed to confirm it's an actual login page.
             accessible_panels.append(full_url)
     return accessible_panels
 
+def _create_log_listener():
+    """
+    Routes log records through a queue drained by a background thread, so
+    concurrent probes never block on console output.
+    Records are printed to stdout as plain messages, like the rest of the
+    console output.
+    Returns the QueueListener, which must be started before a scan and
+    stopped (flushing all pending messages) before printing its results.
+    """
+    log_queue = queue.Queue(-1)
+    log.addHandler(QueueHandler(log_queue))
+    log.propagate = False
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter('%(message)s'))
+    return QueueListener(log_queue, console)
+
 # --- Main Scraper Function ---
 
 def security_scan_website(target_url):
     """
     Performs a basic security scan on the target website.
     """
-    print(f"\n--- Starting Security Scan for: {target_url} ---")
+    log.info("\n--- Starting Security Scan for: %s ---", target_url)
     results = {
         "target_url": target_url,
         "status": "Incomplete",
@@ -119,6 +529,7 @@ def security_scan_website(target_url):
             "open_directory": False,
             "outdated_software_indicators": [],
             "exposed_admin_panels": [],
+            "admin_panels_skipped": None,
             "general_info": []
         },
         "errors": []
@@ -131,24 +542,37 @@ def security_scan_website(target_url):
         results["status"] = "Failed"
         return results
 
-    soup = BeautifulSoup(main_response.text, 'html.parser')
+    # Decode the body once and share the text between all checks. The parser
+    # is told the charset from the Content-Type header, if any, and otherwise
+    # detects it (from <meta charset> or the bytes themselves). The text is
+    # then decoded with the encoding the soup ended up using, so both agree.
+    raw = main_response.content
+    soup = BeautifulSoup(raw, 'lxml', parse_only=_STRAINER,
+                         from_encoding=_declared_encoding(main_response))
+    html_text = _decode_body(raw, soup.original_encoding)
     results["findings"]["general_info"].append(f"Title: {soup.title.get_text() if soup.title else 'N/A'}")
     results["findings"]["general_info"].append(f"HTTP Status Code: {main_response.status_code}")
 
     # 2. Check for Open Directory on the main URL
-    if check_open_directory(main_response):
+    if check_open_directory(soup, html_text):
         results["findings"]["open_directory"] = True
         results["findings"]["general_info"].append("Detected potential open directory listing on main URL.")
 
     # 3. Check for Outdated Software Indicators
-    outdated_software_indicators = check_outdated_software(soup)
+    outdated_software_indicators = check_outdated_software(soup, html_text)
     if outdated_software_indicators:
         results["findings"]["outdated_software_indicators"].extend(outdated_software_indicators)
 
-    # 4. Check for Exposed Admin Panels
-    exposed_admin_panels = check_exposed_admin_panels(target_url)
-    if exposed_admin_panels:
-        results["findings"]["exposed_admin_panels"].extend(exposed_admin_panels)
+    # 4. Check for Exposed Admin Panels (skipped on static site hosts)
+    static_host = _static_host(main_response.url, main_response.headers)
+    if static_host:
+        reason = f"site is served by {static_host}"
+        results["findings"]["admin_panels_skipped"] = reason
+        results["findings"]["general_info"].append(f"Admin panel checks skipped: {reason}.")
+    else:
+        exposed_admin_panels = check_exposed_admin_panels(target_url, main_response.headers)
+        if exposed_admin_panels:
+            results["findings"]["exposed_admin_panels"].extend(exposed_admin_panels)
 
     results["status"] = "Completed"
     return results
@@ -158,10 +582,12 @@ if __name__ == "__main__":
     print("Welcome to the Basic Website Security Scraper!")
     print("Note: This is a simple tool for educational purposes and provides basic indicators.")
     print("It does not perform deep vulnerability scanning.")
+    log_listener = _create_log_listener()
 
     while True:
         url_input = input("\nEnter the URL to scan (e.g., https://example.com) or 'exit' to quit: ").strip()
         if url_input.lower() == 'exit':
+            _RESPONSE_CACHE.clear()
             break
         if not url_input:
             print("Please enter a URL.")
@@ -172,7 +598,11 @@ if __name__ == "__main__":
             print("Warning: URL missing scheme (http:// or https://). Attempting with https://")
             url_input = "https://" + url_input
 
-        scan_results = security_scan_website(url_input)
+        log_listener.start()
+        try:
+            scan_results = security_scan_website(url_input)
+        finally:
+            log_listener.stop()
 
         print("\n--- Scan Results ---")
         print(f"Target URL: {scan_results['target_url']}")
@@ -201,6 +631,8 @@ if __name__ == "__main__":
             for panel_url in scan_results['findings']['exposed_admin_panels']:
                 print(f"        - {panel_url}")
             print("      (Publicly accessible admin panels increase attack surface.)")
+        elif scan_results['findings']['admin_panels_skipped']:
+            print(f"    - Admin panel checks skipped: {scan_results['findings']['admin_panels_skipped']}.")
         else:
             print("    - No common admin panel paths found to be directly accessible.")
 